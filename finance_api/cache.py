@@ -0,0 +1,80 @@
+import json
+import os
+import uuid
+from typing import Any, Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # optional dependency
+    aioredis = None
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_client = (
+    aioredis.from_url(REDIS_URL, decode_responses=True)
+    if aioredis is not None and REDIS_URL
+    else None
+)
+
+
+def enabled() -> bool:
+    return _client is not None
+
+
+async def get_json(key: str) -> Optional[Any]:
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(key)
+    except aioredis.RedisError:
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def set_json(key: str, value: Any, ttl: int) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.setex(key, ttl, json.dumps(value))
+    except aioredis.RedisError:
+        pass
+
+
+# Monotonic per-key counters (used for cheap version stamps). The fallback
+# dict is per-process and resets on restart while the database persists, so
+# a bare counter could validate a stale ETag as current. get_version
+# therefore salts fallback stamps with a per-boot nonce: stamps from other
+# processes or earlier boots never match, degrading to a cache miss instead
+# of a false 304.
+_local_counters: dict = {}
+_BOOT_NONCE = uuid.uuid4().hex[:8]
+
+
+async def incr(key: str) -> None:
+    if _client is not None:
+        try:
+            await _client.incr(key)
+            return
+        except aioredis.RedisError:
+            pass
+    _local_counters[key] = _local_counters.get(key, 0) + 1
+
+
+async def get_version(key: str) -> str:
+    if _client is not None:
+        try:
+            value = await _client.get(key)
+            if value is not None:
+                return str(int(value))
+        except aioredis.RedisError:
+            pass
+    return f"{_BOOT_NONCE}.{_local_counters.get(key, 0)}"
+
+
+async def delete(key: str) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.delete(key)
+    except aioredis.RedisError:
+        pass
@@ -0,0 +1,334 @@
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from . import auth, cache, models, schemas
+
+USER_CACHE_TTL = 300
+
+
+def _tx_version_key(user_id: int) -> str:
+    # Bumped on every transaction write; the report endpoint folds it into
+    # its ETag so unchanged data can be answered with a 304.
+    return f"user:{user_id}:tx_version"
+
+
+# Hot single-row lookups: build the statement once at import time and execute
+# with bound parameters, so each call skips rebuilding the same expression
+# tree and hits SQLAlchemy's compiled-statement cache directly.
+_USER_BY_EMAIL = select(models.User).where(models.User.email == bindparam("email"))
+
+_CATEGORY_BY_ID = select(models.Category).where(
+    models.Category.id == bindparam("category_id"),
+    models.Category.owner_id == bindparam("user_id"),
+)
+
+# Read-only list rows: selecting columns instead of the mapped class skips
+# identity-map bookkeeping and attribute instrumentation per row.
+_TRANSACTION_COLUMNS = (
+    models.Transaction.id,
+    models.Transaction.title,
+    models.Transaction.amount,
+    models.Transaction.type,
+    models.Transaction.category_id,
+    models.Transaction.owner_id,
+)
+
+_TRANSACTION_BY_ID = select(models.Transaction).where(
+    models.Transaction.id == bindparam("transaction_id"),
+    models.Transaction.owner_id == bindparam("user_id"),
+)
+
+
+async def get_user_by_email(db: AsyncSession, email: str):
+    cached = await cache.get_json(f"user:{email}")
+    if cached is not None:
+        # Detached instance carrying just what the auth paths need; never
+        # cache anything beyond id/email/hashed_password.
+        return models.User(**cached)
+    result = await db.execute(_USER_BY_EMAIL, {"email": email})
+    user = result.scalar_one_or_none()
+    if user is not None:
+        await cache.set_json(
+            f"user:{email}",
+            {
+                "id": user.id,
+                "email": user.email,
+                "hashed_password": user.hashed_password,
+            },
+            USER_CACHE_TTL,
+        )
+    return user
+
+
+async def create_user(db: AsyncSession, user: schemas.UserCreate):
+    # Password hashing is deliberately expensive CPU work; keep it off the
+    # event loop.
+    hashed_password = await run_in_threadpool(auth.get_password_hash, user.password)
+    # INSERT ... RETURNING hands back the generated id in the same round
+    # trip, so no post-commit refresh SELECT is needed.
+    result = await db.execute(
+        insert(models.User)
+        .values(email=user.email, hashed_password=hashed_password)
+        .returning(models.User)
+    )
+    db_user = result.scalar_one()
+    await db.commit()
+    await cache.delete(f"user:{db_user.email}")
+    return db_user
+
+
+async def update_user_password_hash(
+    db: AsyncSession, user_id: int, email: str, hashed_password: str
+):
+    await db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(hashed_password=hashed_password)
+    )
+    await db.commit()
+    await cache.delete(f"user:{email}")
+
+
+async def get_categories(db: AsyncSession, user_id: int):
+    # The response schema serializes each category's transactions; batch them
+    # into one IN query instead of one lazy SELECT per category.
+    result = await db.execute(
+        select(models.Category)
+        .options(selectinload(models.Category.transactions))
+        .where(models.Category.owner_id == user_id)
+    )
+    return result.scalars().all()
+
+
+async def get_category(db: AsyncSession, category_id: int, user_id: int):
+    result = await db.execute(
+        _CATEGORY_BY_ID, {"category_id": category_id, "user_id": user_id}
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_category_by_name(db: AsyncSession, name: str, user_id: int):
+    result = await db.execute(
+        select(models.Category).where(
+            models.Category.name == name, models.Category.owner_id == user_id
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def create_category(db: AsyncSession, category: schemas.CategoryCreate, user_id: int):
+    # Get-or-create in one round trip: the uq_category_owner_name constraint
+    # makes duplicates impossible, so no racy SELECT-then-INSERT check.
+    insert_fn = (
+        pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    )
+    result = await db.execute(
+        insert_fn(models.Category)
+        .values(name=category.name, owner_id=user_id)
+        .on_conflict_do_nothing(index_elements=["owner_id", "name"])
+        .returning(models.Category)
+    )
+    db_category = result.scalar_one_or_none()
+    if db_category is None:
+        # Conflict: the category already existed; hand back that row.
+        db_category = await get_category_by_name(
+            db, name=category.name, user_id=user_id
+        )
+    await db.commit()
+    return db_category
+
+
+async def get_transactions(
+    db: AsyncSession,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: int | None = None,
+):
+    # Keyset pagination: "id < cursor" is a single index seek, whereas
+    # OFFSET has to scan and discard skip rows. skip is kept only for older
+    # clients and is ignored when a cursor is given.
+    stmt = select(*_TRANSACTION_COLUMNS).where(models.Transaction.owner_id == user_id)
+    if cursor is not None:
+        stmt = stmt.where(models.Transaction.id < cursor)
+    elif skip:
+        stmt = stmt.offset(skip)
+    stmt = stmt.order_by(models.Transaction.id.desc()).limit(limit)
+    result = await db.execute(stmt)
+    # Plain Core rows; the response schema validates them via attribute access.
+    return result.all()
+
+
+async def stream_transactions(db: AsyncSession, user_id: int):
+    # Server-side cursor: rows arrive in yield_per-sized buffers instead of
+    # being materialized as one list, keeping memory flat for large histories.
+    result = await db.stream(
+        select(models.Transaction)
+        .where(models.Transaction.owner_id == user_id)
+        .order_by(models.Transaction.id)
+        .execution_options(yield_per=200)
+    )
+    async for transaction in result.scalars():
+        yield transaction
+
+
+async def get_transaction(db: AsyncSession, transaction_id: int, user_id: int):
+    result = await db.execute(
+        _TRANSACTION_BY_ID, {"transaction_id": transaction_id, "user_id": user_id}
+    )
+    return result.scalar_one_or_none()
+
+
+async def _apply_spending_delta(
+    db: AsyncSession, user_id: int, category_id: int | None, delta: int
+):
+    """Fold an expense delta into category_totals inside the caller's
+    transaction. Callers must derive the delta atomically from the write
+    itself (RETURNING) or from a FOR UPDATE-locked read of the prior state,
+    or concurrent writers can fold in stale deltas."""
+    if delta == 0 or category_id is None:
+        return
+    insert_fn = (
+        pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    )
+    stmt = (
+        insert_fn(models.CategoryTotal)
+        .values(user_id=user_id, category_id=category_id, total=delta)
+        .on_conflict_do_update(
+            index_elements=["user_id", "category_id"],
+            set_={"total": models.CategoryTotal.total + delta},
+        )
+    )
+    await db.execute(stmt)
+
+
+async def create_transaction(
+    db: AsyncSession, transaction: schemas.TransactionCreate, user_id: int
+):
+    result = await db.execute(
+        insert(models.Transaction)
+        .values(**transaction.model_dump(), owner_id=user_id)
+        .returning(models.Transaction)
+    )
+    db_transaction = result.scalar_one()
+    if db_transaction.type == "expense":
+        await _apply_spending_delta(
+            db, user_id, db_transaction.category_id, db_transaction.amount
+        )
+    await db.commit()
+    await cache.incr(_tx_version_key(user_id))
+    return db_transaction
+
+
+async def create_transactions_bulk(
+    db: AsyncSession, items: list[schemas.TransactionCreate], user_id: int
+):
+    # One multi-VALUES INSERT and one commit instead of a statement + fsync
+    # per row; this is the path CSV/statement imports should use.
+    if not items:
+        return 0
+    rows = [{**item.model_dump(), "owner_id": user_id} for item in items]
+    await db.execute(insert(models.Transaction), rows)
+    deltas: dict[int, int] = {}
+    for row in rows:
+        if row["type"] == "expense" and row["category_id"] is not None:
+            deltas[row["category_id"]] = deltas.get(row["category_id"], 0) + row["amount"]
+    for category_id, delta in deltas.items():
+        await _apply_spending_delta(db, user_id, category_id, delta)
+    await db.commit()
+    await cache.incr(_tx_version_key(user_id))
+    return len(items)
+
+
+async def update_transaction(
+    db: AsyncSession,
+    transaction_id: int,
+    transaction: schemas.TransactionCreate,
+    user_id: int,
+):
+    # Minimal column read of the previous state, needed to reverse its
+    # contribution to category_totals; no ORM hydration happens. FOR UPDATE
+    # locks the row so a concurrent PUT can't read the same old state and
+    # reverse a stale delta after this one commits (no-op on SQLite, which
+    # serializes writers anyway).
+    old_result = await db.execute(
+        select(
+            models.Transaction.amount,
+            models.Transaction.type,
+            models.Transaction.category_id,
+        )
+        .where(
+            models.Transaction.id == transaction_id,
+            models.Transaction.owner_id == user_id,
+        )
+        .with_for_update()
+    )
+    old = old_result.one_or_none()
+    if old is None:
+        return None
+    stmt = (
+        update(models.Transaction)
+        .where(
+            models.Transaction.id == transaction_id,
+            models.Transaction.owner_id == user_id,
+        )
+        .values(**transaction.model_dump())
+        .returning(models.Transaction)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    db_transaction = result.scalar_one_or_none()
+    if db_transaction is not None:
+        if old.type == "expense":
+            await _apply_spending_delta(db, user_id, old.category_id, -old.amount)
+        if db_transaction.type == "expense":
+            await _apply_spending_delta(
+                db, user_id, db_transaction.category_id, db_transaction.amount
+            )
+    await db.commit()
+    if db_transaction is not None:
+        await cache.incr(_tx_version_key(user_id))
+    return db_transaction
+
+
+async def delete_transaction(db: AsyncSession, transaction_id: int, user_id: int):
+    stmt = (
+        delete(models.Transaction)
+        .where(
+            models.Transaction.id == transaction_id,
+            models.Transaction.owner_id == user_id,
+        )
+        .returning(models.Transaction)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    db_transaction = result.scalar_one_or_none()
+    if db_transaction is not None and db_transaction.type == "expense":
+        await _apply_spending_delta(
+            db, user_id, db_transaction.category_id, -db_transaction.amount
+        )
+    await db.commit()
+    if db_transaction is not None:
+        await cache.incr(_tx_version_key(user_id))
+    return db_transaction
+
+
+async def get_spending_by_category(db: AsyncSession, user_id: int):
+    # Reads the maintained running totals: a PK-range lookup independent of
+    # how many transactions the user has.
+    result = await db.execute(
+        select(models.Category.name, models.CategoryTotal.total)
+        .join(
+            models.CategoryTotal,
+            models.CategoryTotal.category_id == models.Category.id,
+        )
+        .where(
+            models.CategoryTotal.user_id == user_id,
+            models.CategoryTotal.total != 0,
+        )
+    )
+    return result.all()
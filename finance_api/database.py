@@ -0,0 +1,51 @@
+import os
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./finance.db")
+
+# Accept plain postgres URLs from the environment and route them through the
+# asyncpg driver.
+if SQLALCHEMY_DATABASE_URL.startswith("postgresql://"):
+    SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace(
+        "postgresql://", "postgresql+asyncpg://", 1
+    )
+
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    # Local development: a single shared connection avoids SQLite
+    # thread-affinity errors under the threaded test client.
+    engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    # The default pool (5 connections + 10 overflow) caps out under load and
+    # surfaces as "QueuePool limit reached" timeouts. Size it explicitly and
+    # pre-ping so requests reuse warm connections instead of handshaking.
+    engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+Base = declarative_base()
+
+# One session per request, installed by the middleware in main. Constructing
+# an AsyncSession is cheap (no connection is checked out until first use), so
+# non-DB requests cost almost nothing.
+request_session: ContextVar[AsyncSession] = ContextVar("request_session")
+
+
+async def get_db() -> AsyncSession:
+    # Thin accessor kept so route signatures and tests using Depends(get_db)
+    # are unchanged.
+    return request_session.get()
@@ -0,0 +1,209 @@
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import List, Optional
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+import orjson
+from fastapi.responses import StreamingResponse
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import auth, cache, crud, models, schemas
+from .database import SessionLocal, engine, get_db, request_session
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    yield
+
+
+app = FastAPI(title="Finance API", lifespan=lifespan)
+
+
+@app.middleware("http")
+async def db_session_middleware(request, call_next):
+    async with SessionLocal() as session:
+        token = request_session.set(session)
+        try:
+            return await call_next(request)
+        finally:
+            request_session.reset(token)
+
+
+@app.post("/users/", response_model=schemas.User)
+async def create_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_db)):
+    if await crud.get_user_by_email(db, email=user.email):
+        raise HTTPException(status_code=400, detail="Email already registered")
+    return await crud.create_user(db=db, user=user)
+
+
+@app.post("/token", response_model=schemas.Token)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
+):
+    user = await crud.get_user_by_email(db, email=form_data.username)
+    password_ok = user is not None and await run_in_threadpool(
+        auth.verify_password, form_data.password, user.hashed_password
+    )
+    if not password_ok:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if auth.needs_rehash(user.hashed_password):
+        # Transparently upgrade legacy bcrypt hashes to argon2id.
+        new_hash = await run_in_threadpool(auth.get_password_hash, form_data.password)
+        await crud.update_user_password_hash(
+            db, user_id=user.id, email=user.email, hashed_password=new_hash
+        )
+    access_token = auth.create_access_token(
+        data={"sub": user.email},
+        expires_delta=timedelta(minutes=auth.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@app.get("/users/me", response_model=schemas.User)
+async def read_users_me(current_user: models.User = Depends(auth.get_current_user)):
+    return current_user
+
+
+@app.post("/categories/", response_model=schemas.Category)
+async def create_category(
+    category: schemas.CategoryCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    # Idempotent: the unique constraint on (owner_id, name) makes a repeat
+    # create return the existing category instead of racing a SELECT check.
+    return await crud.create_category(db=db, category=category, user_id=current_user.id)
+
+
+@app.get("/categories/", response_model=List[schemas.Category])
+async def read_categories(
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    return await crud.get_categories(db, user_id=current_user.id)
+
+
+@app.post("/transactions/", response_model=schemas.Transaction)
+async def create_transaction(
+    transaction: schemas.TransactionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    return await crud.create_transaction(
+        db=db, transaction=transaction, user_id=current_user.id
+    )
+
+
+@app.post("/transactions/bulk", response_model=schemas.TransactionBulkResult)
+async def create_transactions_bulk(
+    bulk: schemas.TransactionBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    inserted = await crud.create_transactions_bulk(
+        db, items=bulk.items, user_id=current_user.id
+    )
+    return {"inserted": inserted}
+
+
+@app.get("/transactions/", response_model=List[schemas.Transaction])
+async def read_transactions(
+    response: Response,
+    cursor: Optional[int] = Query(None, ge=1),
+    skip: int = Query(0, ge=0),  # deprecated: use cursor
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    transactions = await crud.get_transactions(
+        db, user_id=current_user.id, skip=skip, limit=limit, cursor=cursor
+    )
+    if transactions:
+        response.headers["X-Next-Cursor"] = str(transactions[-1].id)
+    return transactions
+
+
+@app.get("/transactions/stream")
+async def stream_transactions(
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    async def generate():
+        # The session lives inside the generator: dependency-scoped sessions
+        # are torn down before a StreamingResponse body runs.
+        async with SessionLocal() as db:
+            async for tx in crud.stream_transactions(db, user_id=current_user.id):
+                yield orjson.dumps(
+                    schemas.Transaction.model_validate(tx).model_dump()
+                ) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.get("/transactions/{transaction_id}", response_model=schemas.Transaction)
+async def read_transaction(
+    transaction_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    db_transaction = await crud.get_transaction(
+        db, transaction_id, user_id=current_user.id
+    )
+    if db_transaction is None:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    return db_transaction
+
+
+@app.put("/transactions/{transaction_id}", response_model=schemas.Transaction)
+async def update_transaction(
+    transaction_id: int,
+    transaction: schemas.TransactionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    db_transaction = await crud.update_transaction(
+        db, transaction_id, transaction, user_id=current_user.id
+    )
+    if db_transaction is None:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    return db_transaction
+
+
+@app.delete("/transactions/{transaction_id}", response_model=schemas.Transaction)
+async def delete_transaction(
+    transaction_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    db_transaction = await crud.delete_transaction(
+        db, transaction_id, user_id=current_user.id
+    )
+    if db_transaction is None:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+    return db_transaction
+
+
+@app.get("/reports/spending-by-category", response_model=List[schemas.CategorySpending])
+async def get_spending_report(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(auth.get_current_user),
+):
+    # The aggregate only changes when the user writes a transaction; the
+    # version counter makes that observable without running the query.
+    version = await cache.get_version(f"user:{current_user.id}:tx_version")
+    etag = f'W/"spending-{current_user.id}-{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    rows = await crud.get_spending_by_category(db, user_id=current_user.id)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=10"
+    return [{"category": name, "total": total} for name, total in rows]
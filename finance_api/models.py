@@ -0,0 +1,64 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from .database import Base
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True, index=True)
+    email = Column(String, unique=True, index=True, nullable=False)
+    hashed_password = Column(String, nullable=False)
+
+    categories = relationship("Category", back_populates="owner")
+    transactions = relationship("Transaction", back_populates="owner")
+
+
+class Category(Base):
+    __tablename__ = "categories"
+    __table_args__ = (
+        UniqueConstraint("owner_id", "name", name="uq_category_owner_name"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
+
+    owner = relationship("User", back_populates="categories")
+    # Safety net against N+1 if a caller skips the eager-load option.
+    transactions = relationship(
+        "Transaction", back_populates="category", lazy="selectin"
+    )
+
+
+class CategoryTotal(Base):
+    """Running expense total per (user, category), maintained on every
+    transaction write so the spending report is a PK-range read instead of
+    an aggregate scan."""
+
+    __tablename__ = "category_totals"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)  # integer cents
+
+
+class Transaction(Base):
+    __tablename__ = "transactions"
+    __table_args__ = (
+        # Every query filters on owner_id; the per-category shape also backs
+        # the one-off category_totals backfill aggregate.
+        Index("ix_tx_owner_cat", "owner_id", "category_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    # Integer cents: exact sums, no float drift, narrower index entries.
+    amount = Column(Integer, nullable=False)
+    type = Column(String, nullable=False)  # "income" or "expense"
+    category_id = Column(Integer, ForeignKey("categories.id"))
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
+
+    owner = relationship("User", back_populates="transactions")
+    category = relationship("Category", back_populates="transactions")
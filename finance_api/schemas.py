@@ -0,0 +1,88 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class TransactionBase(BaseModel):
+    title: str
+    amount: int  # integer cents
+    type: str
+    category_id: Optional[int] = None
+
+    @field_validator("amount", mode="before")
+    @classmethod
+    def _amount_to_cents(cls, value):
+        # Integers are already cents; decimal input (12.50, "12.50") is
+        # treated as currency units and converted.
+        if isinstance(value, (float, str, Decimal)):
+            # InvalidOperation subclasses ArithmeticError, not ValueError, so
+            # pydantic would let it escape as a 500; re-raise as ValueError
+            # to get the usual 422.
+            try:
+                cents = (Decimal(str(value)) * 100).to_integral_value(
+                    rounding=ROUND_HALF_UP
+                )
+                return int(cents)
+            except (InvalidOperation, OverflowError, ValueError):
+                raise ValueError("amount must be a number")
+        return value
+
+
+class TransactionCreate(TransactionBase):
+    pass
+
+
+class TransactionBulkCreate(BaseModel):
+    items: List[TransactionCreate]
+
+
+class TransactionBulkResult(BaseModel):
+    inserted: int
+
+
+class Transaction(TransactionBase):
+    id: int
+    owner_id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CategoryBase(BaseModel):
+    name: str
+
+
+class CategoryCreate(CategoryBase):
+    pass
+
+
+class Category(CategoryBase):
+    id: int
+    owner_id: int
+    transactions: List[Transaction] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserBase(BaseModel):
+    email: str
+
+
+class UserCreate(UserBase):
+    password: str
+
+
+class User(UserBase):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CategorySpending(BaseModel):
+    category: str
+    total: int  # integer cents
+
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
@@ -0,0 +1,47 @@
+import itertools
+import os
+import tempfile
+
+# The engine reads DATABASE_URL at import time, so point it at a throwaway
+# file before anything imports finance_api. A file (not :memory:) lets tests
+# open their own sqlite3 connection to inspect or doctor rows directly.
+_db_fd, _db_path = tempfile.mkstemp(prefix="finance_test_", suffix=".db")
+os.close(_db_fd)
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_path}"
+
+import pytest
+from fastapi.testclient import TestClient
+
+_user_counter = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def client():
+    from finance_api.main import app
+
+    # Context manager runs the lifespan (create_all).
+    with TestClient(app) as test_client:
+        yield test_client
+    os.unlink(_db_path)
+
+
+@pytest.fixture(scope="session")
+def db_path():
+    return _db_path
+
+
+@pytest.fixture()
+def user(client):
+    """A freshly registered user: {email, password, headers}."""
+    email = f"user{next(_user_counter)}@example.com"
+    password = "secret123"
+    response = client.post("/users/", json={"email": email, "password": password})
+    assert response.status_code == 200, response.text
+    response = client.post("/token", data={"username": email, "password": password})
+    assert response.status_code == 200, response.text
+    token = response.json()["access_token"]
+    return {
+        "email": email,
+        "password": password,
+        "headers": {"Authorization": f"Bearer {token}"},
+    }
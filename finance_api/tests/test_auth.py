@@ -0,0 +1,83 @@
+import sqlite3
+
+from passlib.hash import bcrypt
+
+from finance_api import auth
+
+
+def test_register_rejects_duplicate_email(client, user):
+    response = client.post(
+        "/users/", json={"email": user["email"], "password": "other"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_login_rejects_wrong_password(client, user):
+    response = client.post(
+        "/token", data={"username": user["email"], "password": "wrong"}
+    )
+    assert response.status_code == 401
+
+
+def test_login_rejects_unknown_user(client):
+    response = client.post(
+        "/token", data={"username": "nobody@example.com", "password": "x"}
+    )
+    assert response.status_code == 401
+
+
+def test_protected_routes_require_token(client):
+    assert client.get("/transactions/").status_code == 401
+    assert client.get("/users/me").status_code == 401
+
+
+def test_me_returns_current_user(client, user):
+    response = client.get("/users/me", headers=user["headers"])
+    assert response.status_code == 200
+    assert response.json()["email"] == user["email"]
+
+
+def test_token_cache_serves_repeat_requests(client, user):
+    token = user["headers"]["Authorization"].split()[1]
+    auth._token_cache.pop(token, None)
+    assert client.get("/users/me", headers=user["headers"]).status_code == 200
+    assert token in auth._token_cache
+    # Second call is served from the cache entry written by the first.
+    response = client.get("/users/me", headers=user["headers"])
+    assert response.status_code == 200
+    assert response.json()["email"] == user["email"]
+
+
+def test_new_hashes_are_argon2id(client, user, db_path):
+    with sqlite3.connect(db_path) as conn:
+        (hashed,) = conn.execute(
+            "SELECT hashed_password FROM users WHERE email = ?", (user["email"],)
+        ).fetchone()
+    assert hashed.startswith("$argon2id$")
+
+
+def test_legacy_bcrypt_hash_upgrades_on_login(client, user, db_path):
+    # Plant a legacy bcrypt hash as if the user predated the argon2 switch.
+    legacy = bcrypt.using(rounds=4).hash(user["password"])
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE users SET hashed_password = ? WHERE email = ?",
+            (legacy, user["email"]),
+        )
+
+    response = client.post(
+        "/token", data={"username": user["email"], "password": user["password"]}
+    )
+    assert response.status_code == 200
+
+    with sqlite3.connect(db_path) as conn:
+        (hashed,) = conn.execute(
+            "SELECT hashed_password FROM users WHERE email = ?", (user["email"],)
+        ).fetchone()
+    assert hashed.startswith("$argon2id$")
+    # And the upgraded hash still verifies.
+    response = client.post(
+        "/token", data={"username": user["email"], "password": user["password"]}
+    )
+    assert response.status_code == 200
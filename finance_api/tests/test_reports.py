@@ -0,0 +1,107 @@
+def _setup(client, headers):
+    categories = {}
+    for name in ("Food", "Rent"):
+        response = client.post("/categories/", json={"name": name}, headers=headers)
+        categories[name] = response.json()["id"]
+    return categories
+
+
+def _spend(client, headers, category_id, amount, type_="expense", title="tx"):
+    response = client.post(
+        "/transactions/",
+        json={"title": title, "amount": amount, "type": type_, "category_id": category_id},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _report(client, headers, extra_headers=None):
+    return client.get(
+        "/reports/spending-by-category", headers={**headers, **(extra_headers or {})}
+    )
+
+
+def _totals(client, headers):
+    return {
+        row["category"]: row["total"] for row in _report(client, headers).json()
+    }
+
+
+def test_report_sums_expenses_per_category(client, user):
+    headers = user["headers"]
+    categories = _setup(client, headers)
+    _spend(client, headers, categories["Food"], 1000)
+    _spend(client, headers, categories["Food"], 250)
+    _spend(client, headers, categories["Rent"], 90000)
+    # Income and uncategorized rows stay out of the report.
+    _spend(client, headers, categories["Food"], 5000, type_="income")
+    _spend(client, headers, None, 123)
+    assert _totals(client, headers) == {"Food": 1250, "Rent": 90000}
+
+
+def test_totals_follow_updates_across_amount_type_and_category(client, user):
+    headers = user["headers"]
+    categories = _setup(client, headers)
+    tx = _spend(client, headers, categories["Food"], 1000)
+
+    def put(**payload):
+        response = client.put(
+            f"/transactions/{tx['id']}", json=payload, headers=headers
+        )
+        assert response.status_code == 200, response.text
+
+    put(title="tx", amount=1500, type="expense", category_id=categories["Food"])
+    assert _totals(client, headers) == {"Food": 1500}
+
+    put(title="tx", amount=1500, type="expense", category_id=categories["Rent"])
+    assert _totals(client, headers) == {"Rent": 1500}
+
+    put(title="tx", amount=1500, type="income", category_id=categories["Rent"])
+    assert _totals(client, headers) == {}
+
+    put(title="tx", amount=700, type="expense", category_id=categories["Food"])
+    assert _totals(client, headers) == {"Food": 700}
+
+
+def test_totals_follow_deletes(client, user):
+    headers = user["headers"]
+    categories = _setup(client, headers)
+    keep = _spend(client, headers, categories["Food"], 1000)
+    drop = _spend(client, headers, categories["Food"], 250)
+    client.delete(f"/transactions/{drop['id']}", headers=headers)
+    assert _totals(client, headers) == {"Food": 1000}
+    client.delete(f"/transactions/{keep['id']}", headers=headers)
+    # A zeroed category disappears rather than reporting 0.
+    assert _totals(client, headers) == {}
+
+
+def test_bulk_inserts_feed_totals(client, user):
+    headers = user["headers"]
+    categories = _setup(client, headers)
+    items = [
+        {"title": f"tx{i}", "amount": 100, "type": "expense", "category_id": categories["Food"]}
+        for i in range(3)
+    ]
+    client.post("/transactions/bulk", json={"items": items}, headers=headers)
+    assert _totals(client, headers) == {"Food": 300}
+
+
+def test_etag_roundtrip(client, user):
+    headers = user["headers"]
+    categories = _setup(client, headers)
+    _spend(client, headers, categories["Food"], 1000)
+
+    response = _report(client, headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, max-age=10"
+
+    revalidation = _report(client, headers, extra_headers={"If-None-Match": etag})
+    assert revalidation.status_code == 304
+
+    _spend(client, headers, categories["Food"], 500)
+    response = _report(client, headers, extra_headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert _totals(client, headers) == {"Food": 1500}
@@ -0,0 +1,153 @@
+import json
+
+import pytest
+
+
+def _make_category(client, headers, name="Food"):
+    response = client.post("/categories/", json={"name": name}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def _make_transaction(client, headers, **overrides):
+    payload = {"title": "Lunch", "amount": 1250, "type": "expense", "category_id": None}
+    payload.update(overrides)
+    response = client.post("/transactions/", json=payload, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_crud_roundtrip(client, user):
+    headers = user["headers"]
+    category_id = _make_category(client, headers)
+    created = _make_transaction(client, headers, category_id=category_id)
+
+    response = client.get(f"/transactions/{created['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Lunch"
+
+    response = client.put(
+        f"/transactions/{created['id']}",
+        json={"title": "Dinner", "amount": 2000, "type": "expense", "category_id": category_id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["amount"] == 2000
+
+    response = client.delete(f"/transactions/{created['id']}", headers=headers)
+    assert response.status_code == 200
+    assert client.get(f"/transactions/{created['id']}", headers=headers).status_code == 404
+
+
+def test_update_and_delete_missing_return_404(client, user):
+    headers = user["headers"]
+    response = client.put(
+        "/transactions/999999",
+        json={"title": "x", "amount": 1, "type": "expense", "category_id": None},
+        headers=headers,
+    )
+    assert response.status_code == 404
+    assert client.delete("/transactions/999999", headers=headers).status_code == 404
+
+
+def test_users_cannot_see_each_others_transactions(client, user):
+    mine = _make_transaction(client, user["headers"])
+    other = client.post(
+        "/users/", json={"email": f"other-{user['email']}", "password": "pw"}
+    )
+    assert other.status_code == 200
+    token = client.post(
+        "/token", data={"username": f"other-{user['email']}", "password": "pw"}
+    ).json()["access_token"]
+    other_headers = {"Authorization": f"Bearer {token}"}
+    assert client.get(f"/transactions/{mine['id']}", headers=other_headers).status_code == 404
+    assert client.get("/transactions/", headers=other_headers).json() == []
+
+
+@pytest.mark.parametrize(
+    ("amount", "cents"),
+    [(1250, 1250), (12.5, 1250), ("12.50", 1250), ("0.015", 2)],
+)
+def test_amounts_convert_to_cents(client, user, amount, cents):
+    created = _make_transaction(client, user["headers"], amount=amount)
+    assert created["amount"] == cents
+
+
+@pytest.mark.parametrize("amount", ["abc", "nan", "inf", "-inf", ""])
+def test_malformed_amounts_are_422(client, user, amount):
+    response = client.post(
+        "/transactions/",
+        json={"title": "t", "amount": amount, "type": "expense", "category_id": None},
+        headers=user["headers"],
+    )
+    assert response.status_code == 422
+
+
+def test_bulk_insert(client, user):
+    headers = user["headers"]
+    items = [
+        {"title": f"tx{i}", "amount": 100 + i, "type": "expense", "category_id": None}
+        for i in range(5)
+    ]
+    response = client.post("/transactions/bulk", json={"items": items}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 5}
+    assert client.post(
+        "/transactions/bulk", json={"items": []}, headers=headers
+    ).json() == {"inserted": 0}
+    assert len(client.get("/transactions/", headers=headers).json()) == 5
+
+
+def test_keyset_pagination_walks_all_rows_newest_first(client, user):
+    headers = user["headers"]
+    items = [
+        {"title": f"tx{i}", "amount": 100, "type": "income", "category_id": None}
+        for i in range(5)
+    ]
+    client.post("/transactions/bulk", json={"items": items}, headers=headers)
+
+    all_ids = [t["id"] for t in client.get("/transactions/", headers=headers).json()]
+    assert all_ids == sorted(all_ids, reverse=True)
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/transactions/?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url, headers=headers)
+        page = response.json()
+        if not page:
+            break
+        seen += [t["id"] for t in page]
+        cursor = int(response.headers["X-Next-Cursor"])
+    assert seen == all_ids
+
+
+@pytest.mark.parametrize("query", ["limit=-1", "limit=0", "limit=501", "skip=-1", "cursor=0"])
+def test_pagination_params_are_bounded(client, user, query):
+    response = client.get(f"/transactions/?{query}", headers=user["headers"])
+    assert response.status_code == 422
+
+
+def test_stream_returns_ndjson_oldest_first(client, user):
+    headers = user["headers"]
+    first = _make_transaction(client, headers, title="first")
+    second = _make_transaction(client, headers, title="second")
+    response = client.get("/transactions/stream", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [row["id"] for row in rows] == [first["id"], second["id"]]
+
+
+def test_category_create_is_idempotent(client, user):
+    headers = user["headers"]
+    first = _make_category(client, headers, name="Rent")
+    assert _make_category(client, headers, name="Rent") == first
+
+
+def test_categories_serialize_their_transactions(client, user):
+    headers = user["headers"]
+    category_id = _make_category(client, headers)
+    created = _make_transaction(client, headers, category_id=category_id)
+    (category,) = client.get("/categories/", headers=headers).json()
+    assert [t["id"] for t in category["transactions"]] == [created["id"]]